@@ -204,14 +204,15 @@ class LambdaVersionManager:
             with open(definition_file, 'r') as f:
                 definition = f.read()
             
-            # Find state machine ARN
-            response = self.stepfunctions.list_state_machines()
-            state_machine_arn = None
-            
-            for sm in response['stateMachines']:
-                if sm['name'] == state_machine_name:
-                    state_machine_arn = sm['stateMachineArn']
-                    break
+            # Find state machine ARN (paginated, stopping at the first match)
+            paginator = self.stepfunctions.get_paginator('list_state_machines')
+            state_machine_arn = next(
+                (sm['stateMachineArn']
+                 for page in paginator.paginate(PaginationConfig={'PageSize': 1000})
+                 for sm in page['stateMachines']
+                 if sm['name'] == state_machine_name),
+                None
+            )
             
             if not state_machine_arn:
                 raise Exception(f"State machine not found: {state_machine_name}")
@@ -7,10 +7,25 @@ Comprehensive tool for reading per-customer graph nodes and edges from Neptune d
 import boto3
 import json
 import argparse
+import gzip
+import heapq
+import logging
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 import pandas as pd
+from botocore.config import Config
+
+# Arrow columnar writer (optional, falls back to pandas)
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    from pyarrow import parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 # Neptune/Gremlin libraries
 try:
@@ -25,31 +40,100 @@ except ImportError:
     print("📦 Install with: pip install gremlinpython")
     NEPTUNE_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
+# Status levels mapped to logging levels and display icons
+STATUS_LEVELS = {
+    'INFO': logging.INFO,
+    'SUCCESS': logging.INFO,
+    'RUNNING': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR
+}
+STATUS_ICONS = {'INFO': 'ℹ️', 'SUCCESS': '✅', 'WARNING': '⚠️', 'ERROR': '❌', 'RUNNING': '🔄'}
+
+# Number of node/edge types shown in the terminal summary
+SUMMARY_TOP_TYPES = 20
+
+def _configure_logging():
+    """Print status messages to stdout unless the host application configured logging
+
+    Status messages keep the "[HH:MM:SS] icon message" layout.
+    """
+    if logger.hasHandlers():
+        return
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('[%(asctime)s] %(message)s', datefmt='%H:%M:%S'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+
+def _node_type(node: Dict[str, Any], _get=dict.get) -> str:
+    """Node type with label fallback, without building the fallback on every lookup"""
+    node_type = _get(node, 'node_type')
+    return node_type if node_type is not None else _get(node, 'label', 'unknown')
+
+def _edge_type(edge: Dict[str, Any], _get=dict.get) -> str:
+    """Edge type with label fallback, without building the fallback on every lookup"""
+    edge_type = _get(edge, 'edge_type')
+    return edge_type if edge_type is not None else _get(edge, 'label', 'unknown')
+
+def _records_to_table(records: List[Dict[str, Any]]) -> 'pa.Table':
+    """Build an Arrow table over the union of all record keys
+
+    pa.Table.from_pylist infers its schema from the first record only and silently
+    drops keys that first appear later. Columns whose values Arrow cannot unify
+    (e.g. int in one record, str in another) are stored as strings.
+    """
+    columns = {}
+    for key in dict.fromkeys(key for record in records for key in record):
+        values = [record.get(key) for record in records]
+        try:
+            columns[key] = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            columns[key] = pa.array(
+                [None if v is None else json.dumps(v, default=str) if isinstance(v, (dict, list)) else str(v)
+                 for v in values],
+                type=pa.string()
+            )
+    return pa.table(columns)
+
 class NeptuneCustomerGraphReader:
     def __init__(self, profile='development', region='us-west-1', environment='dev'):
         self.profile = profile
         self.region = region
         self.environment = environment
         
+        # Status lines must still be printed when the reader is used outside main()
+        _configure_logging()
+        
         # AWS clients
         self.session = boto3.Session(profile_name=profile, region_name=region)
-        self.s3_client = self.session.client('s3')
+        # Larger pool so batch reads can fan out concurrent GETs; adaptive retries back off on 503s
+        s3_config = Config(
+            max_pool_connections=50,
+            retries={'max_attempts': 5, 'mode': 'adaptive'},
+            tcp_keepalive=True
+        )
+        self.s3_client = self.session.client('s3', config=s3_config)
         
         # Neptune connection (will be initialized when needed)
         self.neptune_endpoint = None
         self.gremlin_client = None
         self.g = None
         
+        # Analyses keyed by (customer_id, source, extraction_id)
+        self._analysis_cache = {}
+        
         # Configuration
         self.account_id = self.session.client('sts').get_caller_identity()['Account']
         self.bucket_name = f"agentic-framework-customer-graphs-{environment}-{self.account_id}"
 
     def print_status(self, message: str, level: str = 'INFO'):
-        """Print formatted status message"""
-        icons = {'INFO': 'ℹ️', 'SUCCESS': '✅', 'WARNING': '⚠️', 'ERROR': '❌', 'RUNNING': '🔄'}
-        icon = icons.get(level, 'ℹ️')
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        print(f"[{timestamp}] {icon} {message}")
+        """Log formatted status message"""
+        log_level = STATUS_LEVELS.get(level, logging.INFO)
+        # Suppressed messages pay no formatting cost
+        if logger.isEnabledFor(log_level):
+            logger.log(log_level, '%s %s', STATUS_ICONS.get(level, 'ℹ️'), message)
 
     def get_neptune_endpoint(self) -> Optional[str]:
         """Get Neptune cluster endpoint from AWS"""
@@ -89,9 +173,9 @@ class NeptuneCustomerGraphReader:
             connection = DriverRemoteConnection(gremlin_endpoint, 'g')
             self.g = traversal().withRemote(connection)
             
-            # Test connection
-            vertex_count = self.g.V().count().next()
-            self.print_status(f"Connected to Neptune - {vertex_count} vertices total", 'SUCCESS')
+            # Test connection with a constant-cost probe (no vertex scan)
+            self.g.inject(1).next()
+            self.print_status("Connected to Neptune", 'SUCCESS')
             return True
             
         except Exception as e:
@@ -103,15 +187,14 @@ class NeptuneCustomerGraphReader:
         try:
             self.print_status("Discovering customers in S3", 'RUNNING')
             
+            # Delimiter makes S3 return only the customer prefixes, not every object
             paginator = self.s3_client.get_paginator('list_objects_v2')
-            pages = paginator.paginate(Bucket=self.bucket_name, Prefix='customer-graphs/')
+            pages = paginator.paginate(Bucket=self.bucket_name, Prefix='customer-graphs/', Delimiter='/')
             
             customers = set()
             for page in pages:
-                for obj in page.get('Contents', []):
-                    key_parts = obj['Key'].split('/')
-                    if len(key_parts) >= 2 and key_parts[0] == 'customer-graphs':
-                        customers.add(key_parts[1])
+                for common_prefix in page.get('CommonPrefixes', []):
+                    customers.add(common_prefix['Prefix'].rstrip('/').rsplit('/', 1)[-1])
             
             customer_list = sorted(list(customers))
             self.print_status(f"Found {len(customer_list)} customers: {', '.join(customer_list)}", 'SUCCESS')
@@ -131,28 +214,27 @@ class NeptuneCustomerGraphReader:
             pages = paginator.paginate(Bucket=self.bucket_name, Prefix=prefix)
             
             extractions = []
+            edge_paths = set()
             for page in pages:
                 for obj in page.get('Contents', []):
-                    if obj['Key'].endswith('/nodes.json'):
+                    if obj['Key'].endswith('/edges.json'):
+                        edge_paths.add(obj['Key'].rsplit('/', 1)[0])
+                    elif obj['Key'].endswith('/nodes.json'):
                         extraction_path = '/'.join(obj['Key'].split('/')[:-1])
                         extraction_id = extraction_path.split('/')[-1]
                         
-                        # Check if edges.json also exists
-                        edges_key = f"{extraction_path}/edges.json"
-                        try:
-                            self.s3_client.head_object(Bucket=self.bucket_name, Key=edges_key)
-                            has_edges = True
-                        except:
-                            has_edges = False
-                        
                         extractions.append({
                             'extraction_id': extraction_id,
                             'path': extraction_path,
                             'timestamp': obj['LastModified'],
-                            'has_nodes': True,
-                            'has_edges': has_edges
+                            'has_nodes': True
                         })
             
+            # edges.json lives under the same prefix, so the LIST already tells us
+            # whether it exists - no per-extraction HEAD round-trip needed
+            for extraction in extractions:
+                extraction['has_edges'] = extraction['path'] in edge_paths
+            
             # Sort by timestamp (newest first)
             extractions.sort(key=lambda x: x['timestamp'], reverse=True)
             
@@ -163,24 +245,106 @@ class NeptuneCustomerGraphReader:
             self.print_status(f"Failed to get extractions: {str(e)}", 'ERROR')
             return []
 
+    def _fetch_json_s3(self, key: str) -> Any:
+        """Fetch and decode a (optionally gzip-encoded) JSON object from the customer graphs bucket"""
+        response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
+        body = response['Body'].read()
+        
+        # Writers may store pre-gzipped payloads to cut transfer size
+        if response.get('ContentEncoding') == 'gzip':
+            body = gzip.decompress(body)
+        
+        return json.loads(body.decode('utf-8'))
+
+    def _get_latest_extractions_s3(self) -> Dict[str, Dict[str, Any]]:
+        """Resolve the latest extraction of every customer with a single paginated LIST"""
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(Bucket=self.bucket_name, Prefix='customer-graphs/')
+        
+        latest = {}
+        edge_paths = set()
+        for page in pages:
+            for obj in page.get('Contents', []):
+                key_parts = obj['Key'].split('/')
+                # customer-graphs/{customer_id}/extractions/{extraction_id}/{file}
+                if len(key_parts) != 5 or key_parts[2] != 'extractions':
+                    continue
+                extraction_path = '/'.join(key_parts[:4])
+                if key_parts[4] == 'edges.json':
+                    edge_paths.add(extraction_path)
+                elif key_parts[4] == 'nodes.json':
+                    customer_id = key_parts[1]
+                    current = latest.get(customer_id)
+                    if current is None or obj['LastModified'] > current['timestamp']:
+                        latest[customer_id] = {
+                            'extraction_id': key_parts[3],
+                            'path': extraction_path,
+                            'timestamp': obj['LastModified']
+                        }
+        
+        for extraction in latest.values():
+            extraction['has_edges'] = extraction['path'] in edge_paths
+        
+        return latest
+
+    def read_customers_batch(self, customer_ids: List[str], max_workers: int = 16) -> Dict[str, Dict[str, Any]]:
+        """Read the latest nodes and edges for many customers from S3 concurrently"""
+        results = {}
+        try:
+            self.print_status(f"Batch reading {len(customer_ids)} customers from S3", 'RUNNING')
+            latest = self._get_latest_extractions_s3()
+            
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {}
+                for customer_id in customer_ids:
+                    extraction = latest.get(customer_id)
+                    if not extraction:
+                        self.print_status(f"No extractions found for customer {customer_id}", 'WARNING')
+                        continue
+                    
+                    results[customer_id] = {
+                        'extraction_id': extraction['extraction_id'],
+                        'nodes': [],
+                        'edges': []
+                    }
+                    files = ['nodes'] + (['edges'] if extraction['has_edges'] else [])
+                    for kind in files:
+                        key = f"{extraction['path']}/{kind}.json"
+                        futures[executor.submit(self._fetch_json_s3, key)] = (customer_id, kind)
+                
+                for future in as_completed(futures):
+                    customer_id, kind = futures[future]
+                    try:
+                        data = future.result()
+                    except Exception as e:
+                        self.print_status(f"Failed to read {kind} for {customer_id}: {str(e)}", 'ERROR')
+                        continue
+                    
+                    # Handle both array and object formats
+                    results[customer_id][kind] = data if isinstance(data, list) else data.get(kind, [])
+            
+            self.print_status(f"Batch read complete for {len(results)} customers", 'SUCCESS')
+            return results
+            
+        except Exception as e:
+            self.print_status(f"Failed to batch read customers: {str(e)}", 'ERROR')
+            return results
+
     def read_customer_nodes_s3(self, customer_id: str, extraction_id: str = None) -> List[Dict[str, Any]]:
         """Read customer nodes from S3"""
         try:
-            # Get latest extraction if not specified
+            # Get latest extraction if not specified (direct callers only;
+            # analyze_customer_graph always resolves it once up front)
             if not extraction_id:
-                extractions = self.get_customer_extractions_s3(customer_id)
-                if not extractions:
-                    self.print_status(f"No extractions found for customer {customer_id}", 'WARNING')
+                extraction_id = self._resolve_latest_extraction(customer_id)
+                if not extraction_id:
                     return []
-                extraction_id = extractions[0]['extraction_id']
-                self.print_status(f"Using latest extraction: {extraction_id}", 'INFO')
             
             # Load nodes
             nodes_key = f"customer-graphs/{customer_id}/extractions/{extraction_id}/nodes.json"
             self.print_status(f"Reading nodes from: {nodes_key}", 'RUNNING')
             
-            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=nodes_key)
-            nodes_data = json.loads(response['Body'].read().decode('utf-8'))
+            nodes_data = self._fetch_json_s3(nodes_key)
             
             # Handle both array and object formats
             if isinstance(nodes_data, list):
@@ -198,22 +362,19 @@ class NeptuneCustomerGraphReader:
     def read_customer_edges_s3(self, customer_id: str, extraction_id: str = None) -> List[Dict[str, Any]]:
         """Read customer edges from S3"""
         try:
-            # Get latest extraction if not specified
+            # Get latest extraction if not specified (direct callers only;
+            # analyze_customer_graph always resolves it once up front)
             if not extraction_id:
-                extractions = self.get_customer_extractions_s3(customer_id)
-                if not extractions:
-                    self.print_status(f"No extractions found for customer {customer_id}", 'WARNING')
+                extraction_id = self._resolve_latest_extraction(customer_id)
+                if not extraction_id:
                     return []
-                extraction_id = extractions[0]['extraction_id']
-                self.print_status(f"Using latest extraction: {extraction_id}", 'INFO')
             
             # Load edges
             edges_key = f"customer-graphs/{customer_id}/extractions/{extraction_id}/edges.json"
             self.print_status(f"Reading edges from: {edges_key}", 'RUNNING')
             
             try:
-                response = self.s3_client.get_object(Bucket=self.bucket_name, Key=edges_key)
-                edges_data = json.loads(response['Body'].read().decode('utf-8'))
+                edges_data = self._fetch_json_s3(edges_key)
                 
                 # Handle both array and object formats
                 if isinstance(edges_data, list):
@@ -240,25 +401,21 @@ class NeptuneCustomerGraphReader:
         try:
             self.print_status(f"Querying Neptune for customer {customer_id} nodes", 'RUNNING')
             
-            # Query nodes with customer_id property
+            # Query nodes with customer_id property. valueMap is used rather than
+            # elementMap because Neptune properties default to set cardinality and
+            # elementMap would keep only one value of a multi-valued property
             vertices = self.g.V().has('customer_id', customer_id).valueMap(True).toList()
             
             nodes = []
             for vertex in vertices:
                 node = {
-                    'id': str(vertex[T.id]),
-                    'label': str(vertex[T.label]) if T.label in vertex else 'Unknown'
+                    'id': str(vertex.pop(T.id)),
+                    'label': str(vertex.pop(T.label, 'Unknown'))
                 }
                 
-                # Add all properties
+                # Unwrap single values; multi-valued properties stay lists
                 for key, value in vertex.items():
-                    if key not in [T.id, T.label]:
-                        # Handle list values (Neptune often returns lists)
-                        if isinstance(value, list) and len(value) == 1:
-                            node[key] = value[0]
-                        else:
-                            node[key] = value
-                
+                    node[key] = value[0] if isinstance(value, list) and len(value) == 1 else value
                 nodes.append(node)
             
             self.print_status(f"Found {len(nodes)} nodes in Neptune for customer {customer_id}", 'SUCCESS')
@@ -315,11 +472,46 @@ class NeptuneCustomerGraphReader:
             self.print_status(f"Failed to query Neptune edges: {str(e)}", 'ERROR')
             return []
 
-    def analyze_customer_graph(self, customer_id: str, source: str = 'auto') -> Dict[str, Any]:
-        """Analyze customer graph data"""
+    def _resolve_latest_extraction(self, customer_id: str) -> Optional[str]:
+        """Resolve the latest S3 extraction ID for a customer"""
+        extractions = self.get_customer_extractions_s3(customer_id)
+        if not extractions:
+            self.print_status(f"No extractions found for customer {customer_id}", 'WARNING')
+            return None
+        
+        extraction_id = extractions[0]['extraction_id']
+        self.print_status(f"Using latest extraction: {extraction_id}", 'INFO')
+        return extraction_id
+
+    def analyze_customer_graph(self, customer_id: str, source: str = 'auto',
+                               include_records: bool = False) -> Dict[str, Any]:
+        """Analyze customer graph data (full nodes/edges only when include_records is set)"""
         self.print_status(f"🔍 Analyzing customer graph: {customer_id}", 'INFO')
         self.print_status("=" * 50, 'INFO')
         
+        # S3 analyses are keyed by extraction so a newer upload is never served stale
+        extraction_id = None
+        if source in ('auto', 's3'):
+            extraction_id = self._resolve_latest_extraction(customer_id)
+            if not extraction_id:
+                return {}
+            
+            # A cached full analysis also serves summary-only callers
+            cache_key = (customer_id, source, extraction_id)
+            cached = self._analysis_cache.get(cache_key)
+            if cached and (not include_records or 'nodes' in cached):
+                self.print_status(f"Using cached analysis for extraction {extraction_id}", 'INFO')
+                return cached
+        
+        analysis = self._analyze_for_extraction(customer_id, extraction_id, source, include_records)
+        if analysis and extraction_id:
+            self._analysis_cache[cache_key] = analysis
+        
+        return analysis
+
+    def _analyze_for_extraction(self, customer_id: str, extraction_id: Optional[str],
+                                source: str, include_records: bool) -> Dict[str, Any]:
+        """Load and analyze a single customer graph snapshot"""
         nodes = []
         edges = []
         
@@ -327,32 +519,24 @@ class NeptuneCustomerGraphReader:
         if source == 'auto':
             # For local development, use S3 directly (Neptune is in VPC)
             self.print_status("Using S3 data source (Neptune is in VPC)", 'INFO')
-            nodes = self.read_customer_nodes_s3(customer_id)
-            edges = self.read_customer_edges_s3(customer_id)
+            nodes = self.read_customer_nodes_s3(customer_id, extraction_id)
+            edges = self.read_customer_edges_s3(customer_id, extraction_id)
         
         elif source == 'neptune':
             nodes = self.read_customer_nodes_neptune(customer_id)
             edges = self.read_customer_edges_neptune(customer_id)
         
         elif source == 's3':
-            nodes = self.read_customer_nodes_s3(customer_id)
-            edges = self.read_customer_edges_s3(customer_id)
+            nodes = self.read_customer_nodes_s3(customer_id, extraction_id)
+            edges = self.read_customer_edges_s3(customer_id, extraction_id)
         
         if not nodes and not edges:
             self.print_status(f"No graph data found for customer {customer_id}", 'WARNING')
             return {}
         
-        # Analyze node types
-        node_types = {}
-        for node in nodes:
-            node_type = node.get('node_type', node.get('label', 'unknown'))
-            node_types[node_type] = node_types.get(node_type, 0) + 1
-        
-        # Analyze edge types
-        edge_types = {}
-        for edge in edges:
-            edge_type = edge.get('edge_type', edge.get('label', 'unknown'))
-            edge_types[edge_type] = edge_types.get(edge_type, 0) + 1
+        # Analyze node and edge types
+        node_types = dict(Counter(map(_node_type, nodes)))
+        edge_types = dict(Counter(map(_edge_type, edges)))
         
         # Create analysis
         analysis = {
@@ -366,18 +550,37 @@ class NeptuneCustomerGraphReader:
                 'edge_types': len(edge_types)
             },
             'node_types': node_types,
-            'edge_types': edge_types,
-            'nodes': nodes,
-            'edges': edges
+            'edge_types': edge_types
         }
         
+        if include_records:
+            analysis['nodes'] = nodes
+            analysis['edges'] = edges
+        else:
+            # Summary consumers only show a few sample nodes
+            analysis['nodes_sample'] = nodes[:3]
+        
         return analysis
 
+    def _write_csv(self, records: List[Dict[str, Any]], output_file: str):
+        """Write records to CSV using pyarrow, falling back to pandas for irregular schemas"""
+        if PYARROW_AVAILABLE:
+            try:
+                pacsv.write_csv(_records_to_table(records), output_file)
+                return
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                # Nested columns can't be written as CSV - let pandas stringify them
+                pass
+        
+        pd.DataFrame(records).to_csv(output_file, index=False)
+
     def export_customer_data(self, customer_id: str, output_format: str = 'json', 
                            output_file: str = None, source: str = 'auto') -> bool:
         """Export customer graph data to various formats"""
         
-        analysis = self.analyze_customer_graph(customer_id, source)
+        # The summary report only needs counts; every other format writes the records
+        analysis = self.analyze_customer_graph(customer_id, source,
+                                               include_records=output_format != 'summary')
         if not analysis:
             return False
         
@@ -397,11 +600,30 @@ class NeptuneCustomerGraphReader:
                 edges_file = output_file.replace('.csv', '_edges.csv')
                 
                 if analysis['nodes']:
-                    pd.DataFrame(analysis['nodes']).to_csv(nodes_file, index=False)
+                    self._write_csv(analysis['nodes'], nodes_file)
+                    self.print_status(f"Nodes exported to: {nodes_file}", 'SUCCESS')
+                
+                if analysis['edges']:
+                    self._write_csv(analysis['edges'], edges_file)
+                    self.print_status(f"Edges exported to: {edges_file}", 'SUCCESS')
+                
+            elif output_format == 'parquet':
+                if not PYARROW_AVAILABLE:
+                    self.print_status("Parquet export requires pyarrow (pip install pyarrow)", 'ERROR')
+                    return False
+                
+                # Export nodes and edges as separate dictionary-encoded Parquet files
+                nodes_file = output_file.replace('.parquet', '_nodes.parquet')
+                edges_file = output_file.replace('.parquet', '_edges.parquet')
+                
+                if analysis['nodes']:
+                    pq.write_table(_records_to_table(analysis['nodes']), nodes_file,
+                                   compression='snappy', use_dictionary=True)
                     self.print_status(f"Nodes exported to: {nodes_file}", 'SUCCESS')
                 
                 if analysis['edges']:
-                    pd.DataFrame(analysis['edges']).to_csv(edges_file, index=False)
+                    pq.write_table(_records_to_table(analysis['edges']), edges_file,
+                                   compression='snappy', use_dictionary=True)
                     self.print_status(f"Edges exported to: {edges_file}", 'SUCCESS')
                 
             elif output_format == 'summary':
@@ -453,20 +675,21 @@ Node Type Distribution:
         
         if analysis['node_types']:
             print(f"\n🔵 Node Types ({len(analysis['node_types'])}):")
-            for node_type, count in sorted(analysis['node_types'].items(), key=lambda x: x[1], reverse=True):
+            for node_type, count in heapq.nlargest(SUMMARY_TOP_TYPES, analysis['node_types'].items(), key=lambda x: x[1]):
                 print(f"   {node_type}: {count}")
         
         if analysis['edge_types']:
             print(f"\n🔗 Edge Types ({len(analysis['edge_types'])}):")
-            for edge_type, count in sorted(analysis['edge_types'].items(), key=lambda x: x[1], reverse=True):
+            for edge_type, count in heapq.nlargest(SUMMARY_TOP_TYPES, analysis['edge_types'].items(), key=lambda x: x[1]):
                 print(f"   {edge_type}: {count}")
         
         # Show sample nodes
-        if analysis['nodes']:
+        sample_nodes = analysis.get('nodes_sample') or analysis.get('nodes', [])[:3]
+        if sample_nodes:
             print(f"\n📋 Sample Nodes (first 3):")
-            for i, node in enumerate(analysis['nodes'][:3]):
+            for i, node in enumerate(sample_nodes):
                 node_id = node.get('id', 'N/A')
-                node_type = node.get('node_type', node.get('label', 'unknown'))
+                node_type = _node_type(node)
                 content = node.get('content', node.get('name', 'N/A'))
                 print(f"   {i+1}. [{node_type}] {content[:50]}{'...' if len(str(content)) > 50 else ''}")
         
@@ -478,15 +701,19 @@ def main():
     parser.add_argument('--list-customers', action='store_true', help='List all customers')
     parser.add_argument('--source', choices=['auto', 'neptune', 's3'], default='auto', 
                        help='Data source (auto=try Neptune first, then S3)')
-    parser.add_argument('--export', choices=['json', 'csv', 'summary'], 
+    parser.add_argument('--export', choices=['json', 'csv', 'parquet', 'summary'], 
                        help='Export format')
     parser.add_argument('--output', help='Output file name')
+    parser.add_argument('--summary', action='store_true',
+                       help='Also print the summary after exporting')
     parser.add_argument('--profile', default='development', help='AWS profile')
     parser.add_argument('--region', default='us-west-1', help='AWS region')
     parser.add_argument('--environment', default='dev', help='Environment')
     
     args = parser.parse_args()
     
+    _configure_logging()
+    
     try:
         reader = NeptuneCustomerGraphReader(
             profile=args.profile,
@@ -518,6 +745,9 @@ def main():
             )
             if not success:
                 sys.exit(1)
+            if args.summary:
+                # Served from the analysis cache populated by the export
+                reader.print_customer_summary(args.customer, args.source)
         else:
             reader.print_customer_summary(args.customer, args.source)
         
@@ -4,15 +4,83 @@ Validation script for Customer Graph Infrastructure
 Verifies that all required AWS resources are properly configured
 """
 
+import argparse
 import boto3
+import glob
 import json
+import os
+import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
+# One session shared by all validators; pool sized for the concurrent fan-out and
+# adaptive retries so simultaneous calls back off (with jitter) when throttled
+SESSION = boto3.session.Session()
+CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    retries={'max_attempts': 10, 'mode': 'adaptive'}
+)
+_CLIENT_LOCK = threading.Lock()
+
+TERRAFORM_DIR = 'terraform'
+TF_OUTPUTS_CACHE = os.path.join('.cache', 'tf-outputs.json')
+
+# Successful validations are reused for a short while so CI re-runs after a
+# transient failure only re-check what failed
+VALIDATION_CACHE_DIR = os.path.join('.cache', 'validation')
+VALIDATION_CACHE_TTL = 60  # seconds
+
+# Console prefix for each validator message level
+LOG_PREFIXES = {'SUCCESS': '✅ ', 'WARNING': '⚠️  ', 'ERROR': '❌ ', 'DETAIL': '   '}
+
+@lru_cache(maxsize=None)
+def get_client(service_name):
+    """Return a cached client for the shared session"""
+    # Session.client() is not thread-safe; clients themselves are
+    with _CLIENT_LOCK:
+        return SESSION.client(service_name, config=CLIENT_CONFIG)
+
+@dataclass(frozen=True)
+class ResourceNames:
+    """Names of the customer graph resources for one account/environment"""
+    bucket: str
+    cluster: str
+    roles: Tuple[str, ...]
+    log_groups: Tuple[str, ...]
+    
+    @classmethod
+    def for_environment(cls, account_id, environment, project_name="agentic-framework"):
+        """Derive resource names from the project naming convention"""
+        return cls(
+            bucket=f"{project_name}-customer-graphs-{environment}-{account_id}",
+            cluster=f"{project_name}-neptune-{environment}",
+            roles=(
+                f"{project_name}-graph-extraction-lambda-{environment}",
+                f"{project_name}-neptune-persistence-lambda-{environment}",
+                f"{project_name}-neptune-monitoring-{environment}"
+            ),
+            log_groups=(
+                f"/aws/lambda/graph-extraction-agent-{environment}",
+                f"/aws/lambda/neptune-persistence-agent-{environment}"
+            )
+        )
+
+def print_log(log):
+    """Print (level, message) entries collected by a validator"""
+    for level, message in log:
+        print(f"{LOG_PREFIXES[level]}{message}")
+
 def check_aws_credentials():
     """Check if AWS credentials are configured"""
     try:
-        sts = boto3.client('sts')
+        sts = get_client('sts')
         identity = sts.get_caller_identity()
         print(f"✅ AWS credentials configured for account: {identity['Account']}")
         return identity['Account']
@@ -25,174 +93,281 @@ def check_aws_credentials():
 
 def validate_s3_bucket(bucket_name):
     """Validate S3 bucket configuration"""
+    log = []
     try:
-        s3 = boto3.client('s3')
+        s3 = get_client('s3')
+        
+        # The bucket checks are independent, so issue them concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            head_future = executor.submit(s3.head_bucket, Bucket=bucket_name)
+            versioning_future = executor.submit(s3.get_bucket_versioning, Bucket=bucket_name)
+            encryption_future = executor.submit(s3.get_bucket_encryption, Bucket=bucket_name)
+            public_access_future = executor.submit(s3.get_public_access_block, Bucket=bucket_name)
         
         # Check if bucket exists
-        s3.head_bucket(Bucket=bucket_name)
-        print(f"✅ S3 bucket '{bucket_name}' exists")
+        head_future.result()
+        log.append(('SUCCESS', f"S3 bucket '{bucket_name}' exists"))
         
         # Check versioning
-        versioning = s3.get_bucket_versioning(Bucket=bucket_name)
+        versioning = versioning_future.result()
         if versioning.get('Status') == 'Enabled':
-            print(f"✅ S3 bucket versioning enabled")
+            log.append(('SUCCESS', "S3 bucket versioning enabled"))
         else:
-            print(f"⚠️  S3 bucket versioning not enabled")
+            log.append(('WARNING', "S3 bucket versioning not enabled"))
         
         # Check encryption
         try:
-            encryption = s3.get_bucket_encryption(Bucket=bucket_name)
+            encryption = encryption_future.result()
             if encryption['ServerSideEncryptionConfiguration']:
-                print(f"✅ S3 bucket encryption configured")
+                log.append(('SUCCESS', "S3 bucket encryption configured"))
         except ClientError as e:
             if e.response['Error']['Code'] == 'ServerSideEncryptionConfigurationNotFoundError':
-                print(f"⚠️  S3 bucket encryption not configured")
+                log.append(('WARNING', "S3 bucket encryption not configured"))
         
         # Check public access block
         try:
-            public_access = s3.get_public_access_block(Bucket=bucket_name)
+            public_access = public_access_future.result()
             config = public_access['PublicAccessBlockConfiguration']
-            if all([config['BlockPublicAcls'], config['BlockPublicPolicy'], 
-                   config['IgnorePublicAcls'], config['RestrictPublicBuckets']]):
-                print(f"✅ S3 bucket public access properly blocked")
+            if (config['BlockPublicAcls'] and config['BlockPublicPolicy'] and
+                    config['IgnorePublicAcls'] and config['RestrictPublicBuckets']):
+                log.append(('SUCCESS', "S3 bucket public access properly blocked"))
             else:
-                print(f"⚠️  S3 bucket public access not fully blocked")
+                log.append(('WARNING', "S3 bucket public access not fully blocked"))
         except ClientError:
-            print(f"⚠️  Could not check S3 bucket public access configuration")
+            log.append(('WARNING', "Could not check S3 bucket public access configuration"))
             
-        return True
+        return True, log
         
     except ClientError as e:
-        print(f"❌ S3 bucket validation failed: {e}")
-        return False
+        log.append(('ERROR', f"S3 bucket validation failed: {e}"))
+        return False, log
 
 def validate_neptune_cluster(cluster_id):
     """Validate Neptune cluster configuration"""
+    log = []
     try:
-        neptune = boto3.client('neptune')
+        neptune = get_client('neptune')
         
         # Check cluster status
-        response = neptune.describe_db_clusters(DBClusterIdentifier=cluster_id)
-        cluster = response['DBClusters'][0]
+        try:
+            cluster = neptune.describe_db_clusters(DBClusterIdentifier=cluster_id)['DBClusters'][0]
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'DBClusterNotFoundFault':
+                raise
+            log.append(('ERROR', f"Neptune cluster '{cluster_id}' not found (DBClusterNotFoundFault)"))
+            return False, log
         
-        print(f"✅ Neptune cluster '{cluster_id}' exists")
-        print(f"   Status: {cluster['Status']}")
-        print(f"   Engine: {cluster['Engine']}")
-        print(f"   Encrypted: {cluster['StorageEncrypted']}")
+        log.append(('SUCCESS', f"Neptune cluster '{cluster_id}' exists"))
+        log.append(('DETAIL', f"Status: {cluster['Status']}"))
+        log.append(('DETAIL', f"Engine: {cluster['Engine']}"))
+        log.append(('DETAIL', f"Encrypted: {cluster['StorageEncrypted']}"))
         
         if cluster['Status'] == 'available':
-            print(f"✅ Neptune cluster is available")
+            log.append(('SUCCESS', "Neptune cluster is available"))
         else:
-            print(f"⚠️  Neptune cluster status: {cluster['Status']}")
+            log.append(('WARNING', f"Neptune cluster status: {cluster['Status']}"))
         
         if cluster['StorageEncrypted']:
-            print(f"✅ Neptune cluster encryption enabled")
+            log.append(('SUCCESS', "Neptune cluster encryption enabled"))
         else:
-            print(f"⚠️  Neptune cluster encryption not enabled")
+            log.append(('WARNING', "Neptune cluster encryption not enabled"))
         
-        # Check instances
-        instances = neptune.describe_db_instances(
-            Filters=[{'Name': 'db-cluster-id', 'Values': [cluster_id]}]
-        )
+        # Check instances (membership comes with the cluster description)
+        members = cluster.get('DBClusterMembers', [])
+        log.append(('SUCCESS', f"Neptune cluster has {len(members)} instance(s)"))
         
-        instance_count = len(instances['DBInstances'])
-        print(f"✅ Neptune cluster has {instance_count} instance(s)")
+        # DBClusterMembers carries no status, so the members are described by
+        # exact identifier in one call (the Neptune API takes a list of
+        # identifiers only as a db-instance-id filter)
+        statuses = {}
+        if members:
+            response = neptune.describe_db_instances(Filters=[{
+                'Name': 'db-instance-id',
+                'Values': [member['DBInstanceIdentifier'] for member in members]
+            }])
+            statuses = {
+                instance['DBInstanceIdentifier']: instance['DBInstanceStatus']
+                for instance in response['DBInstances']
+            }
         
-        for instance in instances['DBInstances']:
-            print(f"   Instance: {instance['DBInstanceIdentifier']} - {instance['DBInstanceStatus']}")
+        for member in members:
+            instance_id = member['DBInstanceIdentifier']
+            role = 'writer' if member['IsClusterWriter'] else 'reader'
+            status = statuses.get(instance_id, 'unknown')
+            log.append(('DETAIL', f"Instance: {instance_id} - {role} - {status}"))
+            if status != 'available':
+                log.append(('WARNING', f"Neptune instance '{instance_id}' status: {status}"))
         
-        return True
+        return True, log
         
     except ClientError as e:
-        print(f"❌ Neptune cluster validation failed: {e}")
-        return False
+        log.append(('ERROR', f"Neptune cluster validation failed: {e}"))
+        return False, log
 
 def validate_iam_roles(role_names):
     """Validate IAM roles exist and have proper policies"""
+    log = []
     try:
-        iam = boto3.client('iam')
+        iam = get_client('iam')
         
+        # One paginated call returns every role with its attached and inline policies
+        paginator = iam.get_paginator('get_account_authorization_details')
+        roles = {
+            role['RoleName']: role
+            for page in paginator.paginate(Filter=['Role'])
+            for role in page['RoleDetailList']
+        }
+        
+        # Record every role's outcome so one missing role doesn't hide the rest
+        all_found = True
         for role_name in role_names:
-            try:
-                role = iam.get_role(RoleName=role_name)
-                print(f"✅ IAM role '{role_name}' exists")
-                
-                # Check attached policies
-                policies = iam.list_attached_role_policies(RoleName=role_name)
-                inline_policies = iam.list_role_policies(RoleName=role_name)
-                
-                total_policies = len(policies['AttachedPolicies']) + len(inline_policies['PolicyNames'])
-                print(f"   Policies attached: {total_policies}")
-                
-            except ClientError as e:
-                if e.response['Error']['Code'] == 'NoSuchEntity':
-                    print(f"❌ IAM role '{role_name}' not found")
-                    return False
-                else:
-                    raise
+            role = roles.get(role_name)
+            if role is None:
+                log.append(('ERROR', f"IAM role '{role_name}' not found"))
+                all_found = False
+                continue
+            
+            log.append(('SUCCESS', f"IAM role '{role_name}' exists"))
+            
+            # Check attached policies
+            total_policies = len(role.get('AttachedManagedPolicies', [])) + len(role.get('RolePolicyList', []))
+            log.append(('DETAIL', f"Policies attached: {total_policies}"))
         
-        return True
+        return all_found, log
         
     except ClientError as e:
-        print(f"❌ IAM role validation failed: {e}")
-        return False
+        log.append(('ERROR', f"IAM role validation failed: {e}"))
+        return False, log
 
 def validate_cloudwatch_log_groups(log_group_names):
     """Validate CloudWatch log groups exist"""
+    log = []
     try:
-        logs = boto3.client('logs')
+        logs = get_client('logs')
+        
+        # Fetch every group under the shared prefix once and check membership locally
+        common_prefix = os.path.commonprefix(list(log_group_names))
+        paginate_args = {'logGroupNamePrefix': common_prefix} if common_prefix else {}
+        paginator = logs.get_paginator('describe_log_groups')
+        existing = {
+            log_group['logGroupName']: log_group
+            for page in paginator.paginate(**paginate_args)
+            for log_group in page['logGroups']
+        }
         
+        all_found = True
         for log_group_name in log_group_names:
-            try:
-                response = logs.describe_log_groups(logGroupNamePrefix=log_group_name)
-                
-                found = False
-                for log_group in response['logGroups']:
-                    if log_group['logGroupName'] == log_group_name:
-                        print(f"✅ CloudWatch log group '{log_group_name}' exists")
-                        print(f"   Retention: {log_group.get('retentionInDays', 'Never expire')} days")
-                        found = True
-                        break
-                
-                if not found:
-                    print(f"❌ CloudWatch log group '{log_group_name}' not found")
-                    return False
-                    
-            except ClientError as e:
-                print(f"❌ Error checking log group '{log_group_name}': {e}")
-                return False
+            log_group = existing.get(log_group_name)
+            if log_group is None:
+                log.append(('ERROR', f"CloudWatch log group '{log_group_name}' not found"))
+                all_found = False
+                continue
+            
+            log.append(('SUCCESS', f"CloudWatch log group '{log_group_name}' exists"))
+            log.append(('DETAIL', f"Retention: {log_group.get('retentionInDays', 'Never expire')} days"))
         
-        return True
+        return all_found, log
         
     except ClientError as e:
-        print(f"❌ CloudWatch log group validation failed: {e}")
-        return False
+        log.append(('ERROR', f"CloudWatch log group validation failed: {e}"))
+        return False, log
 
 def validate_kms_key(key_id):
     """Validate KMS key exists and is enabled"""
+    log = []
     try:
-        kms = boto3.client('kms')
+        kms = get_client('kms')
         
-        key = kms.describe_key(KeyId=key_id)
-        key_metadata = key['KeyMetadata']
+        try:
+            key_metadata = kms.describe_key(KeyId=key_id)['KeyMetadata']
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'NotFoundException':
+                raise
+            log.append(('ERROR', f"KMS key '{key_id}' not found (NotFoundException)"))
+            return False, log
         
-        print(f"✅ KMS key '{key_id}' exists")
-        print(f"   State: {key_metadata['KeyState']}")
-        print(f"   Usage: {key_metadata['KeyUsage']}")
+        log.append(('SUCCESS', f"KMS key '{key_id}' exists"))
+        log.append(('DETAIL', f"State: {key_metadata['KeyState']}"))
+        log.append(('DETAIL', f"Usage: {key_metadata['KeyUsage']}"))
         
         if key_metadata['KeyState'] == 'Enabled':
-            print(f"✅ KMS key is enabled")
+            log.append(('SUCCESS', "KMS key is enabled"))
         else:
-            print(f"⚠️  KMS key state: {key_metadata['KeyState']}")
+            log.append(('WARNING', f"KMS key state: {key_metadata['KeyState']}"))
         
-        return True
+        return True, log
         
     except ClientError as e:
-        print(f"❌ KMS key validation failed: {e}")
-        return False
+        log.append(('ERROR', f"KMS key validation failed: {e}"))
+        return False, log
+
+def load_validation_cache(account_id):
+    """Load unexpired validation results for an account"""
+    cache_file = os.path.join(VALIDATION_CACHE_DIR, f"{account_id}.json")
+    if not os.path.exists(cache_file):
+        return {}
+    
+    try:
+        with open(cache_file) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    now = time.time()
+    return {key: entry for key, entry in cache.items()
+            if now - entry['timestamp'] < VALIDATION_CACHE_TTL}
+
+def save_validation_cache(account_id, cache):
+    """Persist validation results for an account"""
+    os.makedirs(VALIDATION_CACHE_DIR, exist_ok=True)
+    with open(os.path.join(VALIDATION_CACHE_DIR, f"{account_id}.json"), 'w') as f:
+        json.dump(cache, f)
+
+def run_validator(validator, resource, cache):
+    """Run a validator unless a recent successful result is cached; returns (ok, log, cached)"""
+    key = f"{validator.__name__}:{json.dumps(resource)}"
+    entry = cache.get(key) if cache is not None else None
+    if entry:
+        return True, entry['log'], True
+    
+    ok, log = validator(resource)
+    if ok and cache is not None:
+        cache[key] = {'timestamp': time.time(), 'log': log}
+    return ok, log, False
+
+def load_terraform_outputs():
+    """Load Terraform outputs, preferring the local state file over spawning terraform"""
+    state_file = os.path.join(TERRAFORM_DIR, 'terraform.tfstate')
+    if os.path.exists(state_file):
+        with open(state_file) as f:
+            return json.load(f).get('outputs', {})
+    
+    # Remote backend: reuse cached outputs unless the configuration changed since
+    config_files = glob.glob(os.path.join(TERRAFORM_DIR, '*.tf'))
+    config_files += glob.glob(os.path.join(TERRAFORM_DIR, '.terraform', 'terraform.tfstate'))
+    config_mtime = max((os.path.getmtime(path) for path in config_files), default=0)
+    if os.path.exists(TF_OUTPUTS_CACHE) and os.path.getmtime(TF_OUTPUTS_CACHE) > config_mtime:
+        with open(TF_OUTPUTS_CACHE) as f:
+            return json.load(f)
+    
+    result = subprocess.run(['terraform', 'output', '-json'], 
+                          cwd=TERRAFORM_DIR, capture_output=True, text=True)
+    if result.returncode != 0:
+        return {}
+    
+    outputs = json.loads(result.stdout)
+    os.makedirs(os.path.dirname(TF_OUTPUTS_CACHE), exist_ok=True)
+    with open(TF_OUTPUTS_CACHE, 'w') as f:
+        json.dump(outputs, f)
+    return outputs
 
 def main():
     """Main validation function"""
+    parser = argparse.ArgumentParser(description='Validate Customer Graph Infrastructure')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignore validation results cached by a recent run')
+    args = parser.parse_args()
+    
     print("🔍 Validating Customer Graph Infrastructure...")
     print("=" * 50)
     
@@ -201,54 +376,52 @@ def main():
     if not account_id:
         sys.exit(1)
     
+    cache = None if args.no_cache else load_validation_cache(account_id)
+    
     # Get environment from Terraform outputs or use default
     environment = "dev"  # Default environment
     
     # Construct resource names based on naming convention
-    project_name = "agentic-framework"
+    names = ResourceNames.for_environment(account_id, environment)
     
-    bucket_name = f"{project_name}-customer-graphs-{environment}-{account_id}"
-    cluster_id = f"{project_name}-neptune-{environment}"
-    
-    role_names = [
-        f"{project_name}-graph-extraction-lambda-{environment}",
-        f"{project_name}-neptune-persistence-lambda-{environment}",
-        f"{project_name}-neptune-monitoring-{environment}"
+    validators = [
+        ("\n📦 Validating S3 Bucket...", validate_s3_bucket, names.bucket),
+        ("\n🗄️  Validating Neptune Cluster...", validate_neptune_cluster, names.cluster),
+        ("\n🔐 Validating IAM Roles...", validate_iam_roles, names.roles),
+        ("\n📊 Validating CloudWatch Log Groups...", validate_cloudwatch_log_groups, names.log_groups)
     ]
     
-    log_group_names = [
-        f"/aws/lambda/graph-extraction-agent-{environment}",
-        f"/aws/lambda/neptune-persistence-agent-{environment}"
-    ]
+    # Validators hit independent services, so run them concurrently; each collects
+    # its messages and they are printed in order once all have finished. A thread
+    # pool is enough here: the run is a few dozen signed requests, so GIL time spent
+    # signing is negligible next to network latency and an aioboto3 port isn't worth it
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(run_validator, validator, resource, cache)
+                   for _, validator, resource in validators]
+        wait(futures)
     
     validation_results = []
-    
-    print("\n📦 Validating S3 Bucket...")
-    validation_results.append(validate_s3_bucket(bucket_name))
-    
-    print("\n🗄️  Validating Neptune Cluster...")
-    validation_results.append(validate_neptune_cluster(cluster_id))
-    
-    print("\n🔐 Validating IAM Roles...")
-    validation_results.append(validate_iam_roles(role_names))
-    
-    print("\n📊 Validating CloudWatch Log Groups...")
-    validation_results.append(validate_cloudwatch_log_groups(log_group_names))
+    for (title, _, _), future in zip(validators, futures):
+        ok, log, cached = future.result()
+        print(f"{title} (cached)" if cached else title)
+        print_log(log)
+        validation_results.append(ok)
     
     # Try to get KMS key from Terraform output or skip if not available
     try:
-        import subprocess
-        result = subprocess.run(['terraform', 'output', '-json'], 
-                              cwd='terraform', capture_output=True, text=True)
-        if result.returncode == 0:
-            outputs = json.loads(result.stdout)
-            if 'customer_graphs_kms_key_id' in outputs:
-                key_id = outputs['customer_graphs_kms_key_id']['value']
-                print(f"\n🔑 Validating KMS Key...")
-                validation_results.append(validate_kms_key(key_id))
+        outputs = load_terraform_outputs()
+        if 'customer_graphs_kms_key_id' in outputs:
+            key_id = outputs['customer_graphs_kms_key_id']['value']
+            print(f"\n🔑 Validating KMS Key...")
+            ok, log, _ = run_validator(validate_kms_key, key_id, cache)
+            print_log(log)
+            validation_results.append(ok)
     except Exception as e:
         print(f"\n⚠️  Could not validate KMS key: {e}")
     
+    if cache is not None:
+        save_validation_cache(account_id, cache)
+    
     # Summary
     print("\n" + "=" * 50)
     print("📋 Validation Summary")
@@ -4,26 +4,51 @@ Display Fresh Hypergraph Results - Extract and properly display V2 hypergraph da
 """
 
 import boto3
+import io
 import json
+import sys
+from collections import Counter, defaultdict
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson parses the large hypergraph payloads several times faster; its
+# JSONDecodeError subclasses the stdlib one, so error handling is unchanged
+json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+SEPARATOR = "=" * 60
+DIVIDER = "-" * 60
+
 def extract_hypergraph_from_execution_history(execution_arn, profile='development', region='us-west-1'):
     """Extract hypergraph data from Step Functions execution history"""
     session = boto3.Session(profile_name=profile, region_name=region)
     stepfunctions = session.client('stepfunctions')
     
     try:
-        response = stepfunctions.get_execution_history(executionArn=execution_arn)
-        events = response['events']
+        # The hypergraph builder runs near the end of the workflow, so walk the
+        # history newest-first and stop at the first match
+        paginator = stepfunctions.get_paginator('get_execution_history')
+        pages = paginator.paginate(executionArn=execution_arn, reverseOrder=True,
+                                   PaginationConfig={'PageSize': 100})
         
         # Look for the hypergraph builder task completion
-        for event in events:
-            if event['type'] == 'TaskSucceeded':
+        for page in pages:
+            for event in page['events']:
+                if event['type'] != 'TaskSucceeded':
+                    continue
                 details = event.get('taskSucceededEventDetails', {})
                 output = details.get('output', '{}')
                 
+                # Only parse outputs that can contain a hypergraph
+                if 'hypergraph_result' not in output and 'hypernodes' not in output:
+                    continue
+                
                 try:
-                    output_data = json.loads(output)
+                    output_data = json_loads(output)
                     
                     # Check if this is the hypergraph result
                     if 'hypergraph_result' in output_data:
@@ -32,7 +57,7 @@ def extract_hypergraph_from_execution_history(execution_arn, profile='developmen
                             payload = hg_result['Payload']
                             if 'body' in payload:
                                 body_str = payload['body']
-                                body_data = json.loads(body_str)
+                                body_data = json_loads(body_str)
                                 if 'result' in body_data:
                                     return body_data['result']
                     
@@ -41,7 +66,7 @@ def extract_hypergraph_from_execution_history(execution_arn, profile='developmen
                         payload = output_data['Payload']
                         if 'body' in payload:
                             body_str = payload['body']
-                            body_data = json.loads(body_str)
+                            body_data = json_loads(body_str)
                             if 'result' in body_data and 'hypernodes' in body_data['result']:
                                 return body_data['result']
                                 
@@ -59,87 +84,88 @@ def display_hypergraph_analysis(hg_data, customer_name):
     if not hg_data:
         print(f"❌ No hypergraph data found for {customer_name}")
         return
-        
-    print(f"\n🎯 HYPERGRAPH ANALYSIS: {customer_name}")
-    print("=" * 60)
+    
+    # Build the analysis in memory and write it to stdout in one call
+    buf = io.StringIO()
+    print(f"\n🎯 HYPERGRAPH ANALYSIS: {customer_name}", file=buf)
+    print(SEPARATOR, file=buf)
     
     # Basic metrics
     nodes = hg_data.get('hypernodes', [])
     edges = hg_data.get('hyperedges', [])
     metrics = hg_data.get('graph_metrics', {})
     
-    print(f"📊 GRAPH METRICS:")
-    print(f"   Total Nodes: {len(nodes)}")
-    print(f"   Total Edges: {len(edges)}")
-    print(f"   Average Confidence: {metrics.get('average_confidence', 0):.3f}")
-    print(f"   Graph Density: {metrics.get('graph_density', 0):.3f}")
-    print(f"   Quality Score: {hg_data.get('graph_insights', {}).get('quality_score', 0):.3f}")
+    print(f"📊 GRAPH METRICS:", file=buf)
+    print(f"   Total Nodes: {len(nodes)}", file=buf)
+    print(f"   Total Edges: {len(edges)}", file=buf)
+    print(f"   Average Confidence: {metrics.get('average_confidence', 0):.3f}", file=buf)
+    print(f"   Graph Density: {metrics.get('graph_density', 0):.3f}", file=buf)
+    print(f"   Quality Score: {hg_data.get('graph_insights', {}).get('quality_score', 0):.3f}", file=buf)
     
-    # Node type distribution
-    node_types = metrics.get('node_type_distribution', {})
-    print(f"\n🔗 NODE DISTRIBUTION:")
+    # One pass over the nodes collects type counts, samples and the id lookup
+    node_counts = Counter()
+    node_samples = defaultdict(list)
+    id_to_content = {}
+    for node in nodes:
+        node_type = node.get('node_type', 'unknown')
+        node_counts[node_type] += 1
+        if len(node_samples[node_type]) < 3:  # Show max 3 per type
+            node_samples[node_type].append(node)
+        id_to_content[node.get('id')] = node.get('content', 'Unknown')
+    
+    # Node type distribution (computed locally if the payload lacks it)
+    node_types = metrics.get('node_type_distribution') or node_counts
+    print(f"\n🔗 NODE DISTRIBUTION:", file=buf)
     for node_type, count in node_types.items():
-        print(f"   {node_type}: {count}")
+        print(f"   {node_type}: {count}", file=buf)
     
     # Edge type distribution
-    edge_types = metrics.get('edge_type_distribution', {})
-    print(f"\n🔗 EDGE DISTRIBUTION:")
+    edge_types = metrics.get('edge_type_distribution') or Counter(edge.get('edge_type', 'unknown') for edge in edges)
+    print(f"\n🔗 EDGE DISTRIBUTION:", file=buf)
     for edge_type, count in edge_types.items():
-        print(f"   {edge_type}: {count}")
+        print(f"   {edge_type}: {count}", file=buf)
     
     # Sample nodes by type
-    print(f"\n📋 SAMPLE NODES:")
-    node_samples = {}
-    for node in nodes:
-        node_type = node.get('node_type', 'unknown')
-        if node_type not in node_samples:
-            node_samples[node_type] = []
-        if len(node_samples[node_type]) < 3:  # Show max 3 per type
-            node_samples[node_type].append(node)
-    
+    print(f"\n📋 SAMPLE NODES:", file=buf)
     for node_type, sample_nodes in node_samples.items():
-        print(f"\n   {node_type.upper()} NODES:")
+        print(f"\n   {node_type.upper()} NODES:", file=buf)
         for node in sample_nodes:
             confidence = node.get('confidence', 0)
             content = node.get('content', 'Unknown')
-            print(f"     • {content} (confidence: {confidence:.2f})")
+            print(f"     • {content} (confidence: {confidence:.2f})", file=buf)
     
     # Sample edges
-    print(f"\n🔗 SAMPLE RELATIONSHIPS:")
+    print(f"\n🔗 SAMPLE RELATIONSHIPS:", file=buf)
     for i, edge in enumerate(edges[:5], 1):  # Show first 5 edges
         source_id = edge.get('source_node_id', 'unknown')
         target_id = edge.get('target_node_id', 'unknown')
         edge_type = edge.get('edge_type', 'unknown')
         confidence = edge.get('confidence', 0)
         
-        # Find node contents
-        source_content = "Unknown"
-        target_content = "Unknown"
-        for node in nodes:
-            if node.get('id') == source_id:
-                source_content = node.get('content', 'Unknown')
-            if node.get('id') == target_id:
-                target_content = node.get('content', 'Unknown')
+        source_content = id_to_content.get(source_id, "Unknown")
+        target_content = id_to_content.get(target_id, "Unknown")
         
-        print(f"   {i}. {source_content} --[{edge_type}]--> {target_content} (conf: {confidence:.2f})")
+        print(f"   {i}. {source_content} --[{edge_type}]--> {target_content} (conf: {confidence:.2f})", file=buf)
     
     # Graph insights
     insights = hg_data.get('graph_insights', {})
-    print(f"\n💡 GRAPH INSIGHTS:")
-    print(f"   Central Entities: {insights.get('central_entities', [])}")
-    print(f"   Most Common Relationship: {insights.get('most_common_relationship', 'unknown')}")
-    print(f"   Entity Diversity: {insights.get('entity_diversity', 0)}")
+    print(f"\n💡 GRAPH INSIGHTS:", file=buf)
+    print(f"   Central Entities: {insights.get('central_entities', [])}", file=buf)
+    print(f"   Most Common Relationship: {insights.get('most_common_relationship', 'unknown')}", file=buf)
+    print(f"   Entity Diversity: {insights.get('entity_diversity', 0)}", file=buf)
     
     # Processing metadata
     metadata = hg_data.get('processing_metadata', {})
-    print(f"\n🔧 PROCESSING FEATURES:")
+    print(f"\n🔧 PROCESSING FEATURES:", file=buf)
     for feature, enabled in metadata.items():
         status = "✅" if enabled else "❌"
-        print(f"   {status} {feature.replace('_', ' ').title()}")
+        print(f"   {status} {feature.replace('_', ' ').title()}", file=buf)
+    
+    sys.stdout.write(buf.getvalue())
 
 def main():
     print("🔍 FRESH HYPERGRAPH RESULTS ANALYSIS")
-    print("=" * 60)
+    print(SEPARATOR)
     
     # Recent execution ARNs from our fresh tests
     executions = [
@@ -155,7 +181,7 @@ def main():
     
     for execution in executions:
         print(f"\n🎯 ANALYZING: {execution['name']}")
-        print("-" * 60)
+        print(DIVIDER)
         
         # Extract hypergraph data from execution history
         hg_data = extract_hypergraph_from_execution_history(execution['arn'])
@@ -163,7 +189,7 @@ def main():
         # Display analysis
         display_hypergraph_analysis(hg_data, execution['name'])
         
-        print("\n" + "=" * 60)
+        print("\n" + SEPARATOR)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
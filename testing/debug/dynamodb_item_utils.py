@@ -0,0 +1,49 @@
+"""
+Shared helpers for the debug scripts that read agent-performance-metrics items
+"""
+
+import json
+from decimal import Decimal
+
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.config import Config
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson is several times faster on the large hypergraph strings
+json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Keep the connection to DynamoDB alive between lookups and back off
+# adaptively if the table throttles
+CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=10,
+    retries={'mode': 'adaptive', 'max_attempts': 3}
+)
+
+_DESERIALIZER = TypeDeserializer()
+
+def decode_json_field(item: dict, key: str) -> dict:
+    """Return a JSON-string attribute decoded, a native map as-is, or {} if missing"""
+    value = item.get(key)
+    if value is None:
+        return {}
+    return json_loads(value) if isinstance(value, (str, bytes)) else value
+
+def to_native(value):
+    """Replace DynamoDB Decimals with int/float so cached and fresh items match"""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, dict):
+        return {k: to_native(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [to_native(v) for v in value]
+    return value
+
+def deserialize_item(item: dict) -> dict:
+    """Convert a typed DynamoDB item into plain Python values"""
+    return {name: to_native(_DESERIALIZER.deserialize(value)) for name, value in item.items()}
@@ -4,152 +4,205 @@ Script to examine current hypergraph builder output
 """
 
 import boto3
+import io
 import json
-from pprint import pprint
+import os
+import sys
+from collections import defaultdict
+from itertools import islice
+
+from dynamodb_item_utils import CLIENT_CONFIG, ORJSON_AVAILABLE, decode_json_field, deserialize_item
+
+if ORJSON_AVAILABLE:
+    import orjson
+
+def format_properties(properties):
+    """Render a properties dict as compact JSON with sorted keys"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(properties, default=str, option=orjson.OPT_SORT_KEYS).decode()
+    return json.dumps(properties, default=str, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+
+# Completed executions never change, so their hypergraph output is kept on disk
+ITEM_CACHE_DIR = os.path.join('.cache', 'hypergraph-output')
+
+def get_item(dynamodb, execution_id):
+    """Get an execution's hypergraph item, from the disk cache when possible"""
+    cache_file = os.path.join(ITEM_CACHE_DIR, f"{execution_id}.json")
+    try:
+        with open(cache_file) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+    
+    response = dynamodb.get_item(
+        TableName='agent-performance-metrics',
+        Key={
+            'execution_id': {'S': execution_id},
+            'agent_type': {'S': 'customer_processing'}
+        },
+        ProjectionExpression='hypergraph_data, processing_status'
+    )
+    if 'Item' not in response:
+        return None
+    item = deserialize_item(response['Item'])
+    
+    if item and item.get('processing_status') == 'completed':
+        os.makedirs(ITEM_CACHE_DIR, exist_ok=True)
+        with open(cache_file, 'w') as f:
+            json.dump(item, f, default=str)
+    return item
 
 def examine_hypergraph_output():
     # Initialize DynamoDB
     session = boto3.Session(profile_name='development', region_name='us-west-1')
-    dynamodb = session.resource('dynamodb')
-    table = dynamodb.Table('agent-performance-metrics')
+    dynamodb = session.client('dynamodb', config=CLIENT_CONFIG)
     
     # Get the test execution result
     execution_id = "test-00_tim_wolff-1756434139-70a045c3"
     
+    # Build the report in memory and write it to stdout in one call
+    buf = io.StringIO()
+    
     try:
-        response = table.get_item(
-            Key={
-                'execution_id': execution_id,
-                'agent_type': 'customer_processing'
-            }
-        )
+        item = get_item(dynamodb, execution_id)
         
-        if 'Item' in response:
-            item = response['Item']
+        if item:
             
             # Extract hypergraph data
             if 'hypergraph_data' in item:
-                hypergraph_str = item['hypergraph_data']
-                
-                # Parse the JSON string
-                hypergraph_data = json.loads(hypergraph_str)
+                # Parse the JSON string (a native DynamoDB map needs no decoding)
+                hypergraph_data = decode_json_field(item, 'hypergraph_data')
                 
-                print("🔍 CURRENT HYPERGRAPH BUILDER OUTPUT ANALYSIS")
-                print("=" * 60)
+                print("🔍 CURRENT HYPERGRAPH BUILDER OUTPUT ANALYSIS", file=buf)
+                print("=" * 60, file=buf)
                 
-                # Parse the nested structure
+                # Parse the nested structure - the body is only decoded when it
+                # is still a string, and a bare result needs no body at all
                 if 'body' in hypergraph_data:
-                    body_data = json.loads(hypergraph_data['body'])
+                    body_data = decode_json_field(hypergraph_data, 'body')
+                elif 'result' in hypergraph_data:
+                    body_data = hypergraph_data
+                else:
+                    body_data = None
+                
+                if body_data is not None:
                     result = body_data.get('result', {})
                     
-                    print(f"📊 HYPERGRAPH STATISTICS:")
-                    print(f"   Total Nodes: {len(result.get('hypernodes', []))}")
-                    print(f"   Total Edges: {len(result.get('hyperedges', []))}")
+                    print(f"📊 HYPERGRAPH STATISTICS:", file=buf)
+                    print(f"   Total Nodes: {len(result.get('hypernodes', []))}", file=buf)
+                    print(f"   Total Edges: {len(result.get('hyperedges', []))}", file=buf)
                     
-                    print(f"\n🔗 NODES ANALYSIS:")
+                    print(f"\n🔗 NODES ANALYSIS:", file=buf)
                     nodes = result.get('hypernodes', [])
-                    node_types = {}
+                    node_types = defaultdict(list)
                     
                     for node in nodes:
-                        node_type = node.get('type', 'unknown')
-                        if node_type not in node_types:
-                            node_types[node_type] = []
-                        node_types[node_type].append(node)
+                        node_types[node.get('type', 'unknown')].append(node)
                     
                     for node_type, type_nodes in node_types.items():
-                        print(f"\n   {node_type.upper()} NODES ({len(type_nodes)}):")
-                        for node in type_nodes[:5]:  # Show first 5
+                        print(f"\n   {node_type.upper()} NODES ({len(type_nodes)}):", file=buf)
+                        for node in islice(type_nodes, 5):  # Show first 5
                             label = node.get('label', 'No label')
                             properties = node.get('properties', {})
-                            print(f"     • {label} - {properties}")
+                            print(f"     • {label} - {format_properties(properties)}", file=buf)
                     
-                    print(f"\n🔗 EDGES ANALYSIS:")
+                    print(f"\n🔗 EDGES ANALYSIS:", file=buf)
                     edges = result.get('hyperedges', [])
-                    edge_types = {}
+                    edge_types = defaultdict(list)
                     
                     for edge in edges:
-                        edge_type = edge.get('type', 'unknown')
-                        if edge_type not in edge_types:
-                            edge_types[edge_type] = []
-                        edge_types[edge_type].append(edge)
+                        edge_types[edge.get('type', 'unknown')].append(edge)
                     
                     for edge_type, type_edges in edge_types.items():
-                        print(f"\n   {edge_type.upper()} EDGES ({len(type_edges)}):")
-                        for edge in type_edges[:3]:  # Show first 3
+                        print(f"\n   {edge_type.upper()} EDGES ({len(type_edges)}):", file=buf)
+                        for edge in islice(type_edges, 3):  # Show first 3
                             source = edge.get('source', 'unknown')
                             target = edge.get('target', 'unknown')
                             properties = edge.get('properties', {})
-                            print(f"     • {source} → {target} - {properties}")
-                    
-                    print(f"\n📋 DETAILED NODE BREAKDOWN:")
-                    print("-" * 40)
-                    for i, node in enumerate(nodes[:10]):  # Show first 10 nodes
-                        print(f"{i+1}. ID: {node.get('id', 'N/A')}")
-                        print(f"   Type: {node.get('type', 'N/A')}")
-                        print(f"   Label: {node.get('label', 'N/A')}")
-                        print(f"   Properties: {node.get('properties', {})}")
-                        print()
-                    
-                    print(f"\n📋 DETAILED EDGE BREAKDOWN:")
-                    print("-" * 40)
-                    for i, edge in enumerate(edges[:10]):  # Show first 10 edges
-                        print(f"{i+1}. ID: {edge.get('id', 'N/A')}")
-                        print(f"   Type: {edge.get('type', 'N/A')}")
-                        print(f"   Source: {edge.get('source', 'N/A')}")
-                        print(f"   Target: {edge.get('target', 'N/A')}")
-                        print(f"   Properties: {edge.get('properties', {})}")
-                        print()
-                    
-                    print(f"\n🎯 ISSUES IDENTIFIED:")
-                    print("-" * 40)
+                            print(f"     • {source} → {target} - {format_properties(properties)}", file=buf)
+                    
+                    print(f"\n📋 DETAILED NODE BREAKDOWN:", file=buf)
+                    print("-" * 40, file=buf)
+                    for i, node in enumerate(islice(nodes, 10)):  # Show first 10 nodes
+                        print(f"{i+1}. ID: {node.get('id', 'N/A')}", file=buf)
+                        print(f"   Type: {node.get('type', 'N/A')}", file=buf)
+                        print(f"   Label: {node.get('label', 'N/A')}", file=buf)
+                        print(f"   Properties: {format_properties(node.get('properties', {}))}", file=buf)
+                        print(file=buf)
+                    
+                    print(f"\n📋 DETAILED EDGE BREAKDOWN:", file=buf)
+                    print("-" * 40, file=buf)
+                    for i, edge in enumerate(islice(edges, 10)):  # Show first 10 edges
+                        print(f"{i+1}. ID: {edge.get('id', 'N/A')}", file=buf)
+                        print(f"   Type: {edge.get('type', 'N/A')}", file=buf)
+                        print(f"   Source: {edge.get('source', 'N/A')}", file=buf)
+                        print(f"   Target: {edge.get('target', 'N/A')}", file=buf)
+                        print(f"   Properties: {format_properties(edge.get('properties', {}))}", file=buf)
+                        print(file=buf)
+                    
+                    print(f"\n🎯 ISSUES IDENTIFIED:", file=buf)
+                    print("-" * 40, file=buf)
                     
                     issues = []
                     
-                    # Check for entity classification issues
-                    entity_nodes = [n for n in nodes if n.get('type') == 'entity']
+                    # Gather everything the checks need in one pass over the
+                    # entity nodes (already grouped above) and one over the edges
+                    entity_nodes = node_types.get('entity', [])
+                    entity_ids = set()
                     for entity in entity_nodes:
+                        entity_ids.add(entity.get('id'))
+                        # Check for entity classification issues
                         if entity.get('properties', {}).get('entity_type') == 'unknown':
                             issues.append(f"❌ Entity '{entity.get('label')}' has unknown type")
                     
+                    semantic_edge_count = 0
+                    entity_edge_count = 0
+                    for e in edges:
+                        get = e.get
+                        if 'semantic' in get('type', '').lower():
+                            semantic_edge_count += 1
+                        if get('source') in entity_ids or get('target') in entity_ids:
+                            entity_edge_count += 1
+                    
                     # Check for edge quality
                     if len(edges) < len(nodes) * 0.5:
                         issues.append(f"❌ Too few edges ({len(edges)}) for {len(nodes)} nodes")
                     
                     # Check for semantic relationships
-                    semantic_edges = [e for e in edges if 'semantic' in e.get('type', '').lower()]
-                    if len(semantic_edges) == 0:
+                    if semantic_edge_count == 0:
                         issues.append("❌ No semantic relationships detected")
                     
                     # Check for entity relationships
-                    entity_edges = [e for e in edges if any(n.get('type') == 'entity' for n in nodes if n.get('id') in [e.get('source'), e.get('target')])]
-                    if len(entity_edges) < len(entity_nodes):
+                    if entity_edge_count < len(entity_nodes):
                         issues.append("❌ Entities are not well connected")
                     
                     for issue in issues:
-                        print(f"   {issue}")
+                        print(f"   {issue}", file=buf)
                     
                     if not issues:
-                        print("   ✅ No major issues detected")
-                    
-                    print(f"\n💡 IMPROVEMENT RECOMMENDATIONS:")
-                    print("-" * 40)
-                    print("   1. 🤖 Use LLM for better entity classification")
-                    print("   2. 🔗 Improve semantic relationship detection")
-                    print("   3. 📊 Add domain-specific entity types (PERSON, ORGANIZATION, CONCEPT)")
-                    print("   4. 🧠 Connect entities to psychological needs more intelligently")
-                    print("   5. 📈 Add confidence scoring for relationships")
-                    print("   6. 🎯 Create more meaningful edge types (INFLUENCES, RELATES_TO, PART_OF)")
+                        print("   ✅ No major issues detected", file=buf)
+                    
+                    print(f"\n💡 IMPROVEMENT RECOMMENDATIONS:", file=buf)
+                    print("-" * 40, file=buf)
+                    print("   1. 🤖 Use LLM for better entity classification", file=buf)
+                    print("   2. 🔗 Improve semantic relationship detection", file=buf)
+                    print("   3. 📊 Add domain-specific entity types (PERSON, ORGANIZATION, CONCEPT)", file=buf)
+                    print("   4. 🧠 Connect entities to psychological needs more intelligently", file=buf)
+                    print("   5. 📈 Add confidence scoring for relationships", file=buf)
+                    print("   6. 🎯 Create more meaningful edge types (INFLUENCES, RELATES_TO, PART_OF)", file=buf)
                 
                 else:
-                    print("❌ Could not parse hypergraph data structure")
-                    print("Raw data:", hypergraph_data)
+                    print("❌ Could not parse hypergraph data structure", file=buf)
+                    print("Raw data:", hypergraph_data, file=buf)
             else:
-                print("❌ No hypergraph data found in the result")
+                print("❌ No hypergraph data found in the result", file=buf)
         else:
-            print(f"❌ No data found for execution ID: {execution_id}")
+            print(f"❌ No data found for execution ID: {execution_id}", file=buf)
             
     except Exception as e:
-        print(f"❌ Error examining hypergraph output: {str(e)}")
+        print(f"❌ Error examining hypergraph output: {str(e)}", file=buf)
+    finally:
+        sys.stdout.write(buf.getvalue())
 
 if __name__ == "__main__":
     examine_hypergraph_output()
\ No newline at end of file
@@ -5,61 +5,178 @@ Verify Fresh Test Results - Extract and compare hypergraph data from recent exec
 
 import boto3
 import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+
+from dynamodb_item_utils import CLIENT_CONFIG, decode_json_field, deserialize_item
+
+TABLE_NAME = 'agent-performance-metrics'
+
+# BatchGetItem rounds spent retrying UnprocessedKeys before giving up on them
+MAX_UNPROCESSED_RETRIES = 8
+
+# Only the attributes _parse_item reads
+PROJECTION = 'execution_id, hypergraph_data, needs_analysis, customer_name, file_path, processing_status'
+
+# Completed executions never change, so their items are kept on disk
+ITEM_CACHE_DIR = os.path.join('.cache', 'hypergraph-items')
+
+def _read_cached_item(execution_id):
+    """Load a completed execution's item from the disk cache"""
+    try:
+        with open(os.path.join(ITEM_CACHE_DIR, f"{execution_id}.json")) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _cache_item(item):
+    """Save an item to the disk cache if its execution has completed"""
+    if item.get('processing_status') != 'completed':
+        return
+    os.makedirs(ITEM_CACHE_DIR, exist_ok=True)
+    with open(os.path.join(ITEM_CACHE_DIR, f"{item['execution_id']}.json"), 'w') as f:
+        json.dump(item, f, default=str)
+
+@lru_cache(maxsize=None)
+def _get_dynamodb(profile, region):
+    """Build the low-level DynamoDB client once per profile/region"""
+    session = boto3.Session(profile_name=profile, region_name=region)
+    return session.client('dynamodb', config=CLIENT_CONFIG)
+
+def _key(execution_id):
+    """Typed primary key for an execution's customer processing item"""
+    return {'execution_id': {'S': execution_id}, 'agent_type': {'S': 'customer_processing'}}
 
 def get_hypergraph_data(execution_id, profile='development', region='us-west-1'):
     """Extract hypergraph data from DynamoDB for a specific execution"""
-    session = boto3.Session(profile_name=profile, region_name=region)
-    dynamodb = session.resource('dynamodb')
-    table = dynamodb.Table('agent-performance-metrics')
+    try:
+        return _load_hypergraph_data(execution_id, profile, region)
+    except Exception as e:
+        print(f"Error retrieving data for {execution_id}: {str(e)}")
+        return None
+
+@lru_cache(maxsize=128)
+def _load_hypergraph_data(execution_id, profile, region):
+    """Fetch and parse one execution; raises on errors so failures are not memoized"""
+    cached = _read_cached_item(execution_id)
+    if cached:
+        return _parse_item(cached)
+    
+    response = _get_dynamodb(profile, region).get_item(
+        TableName=TABLE_NAME,
+        Key=_key(execution_id),
+        ProjectionExpression=PROJECTION
+    )
+    
+    if 'Item' not in response:
+        return None
+    
+    item = deserialize_item(response['Item'])
+    _cache_item(item)
+    return _parse_item(item)
+
+def get_hypergraph_data_batch(execution_ids, profile='development', region='us-west-1'):
+    """Extract hypergraph data for several executions with BatchGetItem"""
+    dynamodb = _get_dynamodb(profile, region)
+    results = {}
+    pending = []
+    for execution_id in dict.fromkeys(execution_ids):  # BatchGetItem rejects duplicate keys
+        cached = _read_cached_item(execution_id)
+        if cached:
+            results[execution_id] = _parse_item(cached)
+        else:
+            pending.append(execution_id)
+    execution_ids = pending
+    
+    # BatchGetItem accepts at most 100 keys per request. Chunks are fetched
+    # concurrently and decoded here as each one arrives, so parsing overlaps
+    # the remaining network calls
+    chunks = [execution_ids[i:i + 100] for i in range(0, len(execution_ids), 100)]
+    if not chunks:
+        return results
     
     try:
-        response = table.get_item(
-            Key={
-                'execution_id': execution_id,
-                'agent_type': 'customer_processing'
-            }
-        )
-        
-        if 'Item' not in response:
-            return None
-            
-        item = response['Item']
+        with ThreadPoolExecutor(max_workers=min(8, len(chunks))) as executor:
+            futures = [executor.submit(_fetch_chunk, dynamodb, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                for raw_item in future.result():
+                    item = deserialize_item(raw_item)
+                    _cache_item(item)
+                    results[item['execution_id']] = _parse_item(item)
+                    
+    except Exception as e:
+        print(f"Error retrieving data for {len(execution_ids)} executions: {str(e)}")
+    
+    return results
+
+def _fetch_chunk(dynamodb, execution_ids):
+    """BatchGetItem up to 100 executions, retrying unprocessed keys with backoff"""
+    items = []
+    request = {
+        TABLE_NAME: {
+            'Keys': [_key(execution_id) for execution_id in execution_ids],
+            'ProjectionExpression': PROJECTION
+        }
+    }
+    attempt = 0
+    while request:
+        response = dynamodb.batch_get_item(RequestItems=request)
+        items.extend(response['Responses'].get(TABLE_NAME, []))
         
+        request = response.get('UnprocessedKeys')
+        if request and attempt < MAX_UNPROCESSED_RETRIES:
+            time.sleep(min(0.1 * 2 ** attempt, 5))
+            attempt += 1
+        elif request:
+            # Still throttled - skip these keys instead of waiting forever
+            skipped = [key['execution_id']['S'] for key in request[TABLE_NAME]['Keys']]
+            print(f"Skipping {len(skipped)} executions still unprocessed after retries: {', '.join(skipped)}")
+            break
+    
+    return items
+
+def _parse_item(item):
+    """Decode a performance metrics item into the verification record"""
+    execution_id = item['execution_id']
+    
+    try:
         # Extract customer info
         customer_name = item.get('customer_name', 'Unknown')
         file_path = item.get('file_path', 'Unknown')
+        processing_status = item.get('processing_status', 'unknown')
+        
+        record = {
+            'execution_id': execution_id,
+            'customer_name': customer_name,
+            'file_path': file_path,
+            'processing_status': processing_status
+        }
+        
+        # Runs that did not complete have nothing worth decoding
+        if processing_status != 'completed':
+            return record
         
         # Extract hypergraph data
-        hypergraph_raw = item.get('hypergraph_data', '{}')
-        if isinstance(hypergraph_raw, str):
-            hypergraph_data = json.loads(hypergraph_raw)
-        else:
-            hypergraph_data = hypergraph_raw
+        hypergraph_data = decode_json_field(item, 'hypergraph_data')
             
         # Extract needs analysis
-        needs_raw = item.get('needs_analysis', '{}')
-        if isinstance(needs_raw, str):
-            needs_data = json.loads(needs_raw)
-            if 'body' in needs_data:
-                needs_body = json.loads(needs_data['body'])
-                needs_result = needs_body.get('result', {})
-            else:
-                needs_result = needs_data
+        needs_data = decode_json_field(item, 'needs_analysis')
+        if 'body' in needs_data:
+            needs_result = decode_json_field(needs_data, 'body').get('result', {})
         else:
-            needs_result = needs_raw
+            needs_result = needs_data
             
-        return {
-            'execution_id': execution_id,
-            'customer_name': customer_name,
-            'file_path': file_path,
-            'hypergraph': hypergraph_data,
-            'needs_analysis': needs_result,
-            'processing_status': item.get('processing_status', 'unknown')
-        }
+        record['hypergraph'] = hypergraph_data
+        record['needs_analysis'] = needs_result
+        return record
         
     except Exception as e:
-        print(f"Error retrieving data for {execution_id}: {str(e)}")
+        print(f"Error decoding data for {execution_id}: {str(e)}")
         return None
 
 def analyze_hypergraph(data):
@@ -71,17 +188,11 @@ def analyze_hypergraph(data):
     nodes = hg.get('nodes', [])
     edges = hg.get('edges', [])
     
-    # Count node types
-    node_types = {}
-    for node in nodes:
-        node_type = node.get('type', 'unknown')
-        node_types[node_type] = node_types.get(node_type, 0) + 1
-    
-    # Count edge types  
-    edge_types = {}
-    for edge in edges:
-        edge_type = edge.get('type', 'unknown')
-        edge_types[edge_type] = edge_types.get(edge_type, 0) + 1
+    # Count node and edge types. Counter tallies in C; pandas value_counts on
+    # an object column would first have to copy every type string into an
+    # array, so it is not faster even for very large graphs
+    node_types = dict(Counter(node.get('type', 'unknown') for node in nodes))
+    edge_types = dict(Counter(edge.get('type', 'unknown') for edge in edges))
         
     return {
         'total_nodes': len(nodes),
@@ -108,6 +219,16 @@ def analyze_needs(data):
         'confidence_score': needs.get('confidence_score', 0)
     }
 
+@lru_cache(maxsize=128)
+def analyze_hypergraph_by_id(execution_id, profile='development', region='us-west-1'):
+    """Analyze an execution's hypergraph, memoized by execution ID (raises on fetch errors)"""
+    return analyze_hypergraph(_load_hypergraph_data(execution_id, profile, region))
+
+@lru_cache(maxsize=128)
+def analyze_needs_by_id(execution_id, profile='development', region='us-west-1'):
+    """Analyze an execution's needs analysis, memoized by execution ID (raises on fetch errors)"""
+    return analyze_needs(_load_hypergraph_data(execution_id, profile, region))
+
 def main():
     print("🔍 FRESH TEST RESULTS VERIFICATION")
     print("=" * 60)
@@ -118,12 +239,14 @@ def main():
         "test-01_jon_fortt-1757370279-4e5381bc"
     ]
     
+    # Fetch all executions in one round trip
+    all_data = get_hypergraph_data_batch(executions)
+    
     for execution_id in executions:
         print(f"\n📊 ANALYZING: {execution_id}")
         print("-" * 60)
         
-        # Get data
-        data = get_hypergraph_data(execution_id)
+        data = all_data.get(execution_id)
         if not data:
             print(f"❌ No data found for {execution_id}")
             continue
@@ -142,11 +265,11 @@ def main():
             print(f"   Edge Types: {hg_analysis['edge_types']}")
             
             print(f"\n   Sample Nodes:")
-            for i, node in enumerate(hg_analysis['nodes'][:3], 1):
+            for i, node in enumerate(islice(hg_analysis['nodes'], 3), 1):
                 print(f"     {i}. {node.get('label', 'Unknown')} ({node.get('type', 'unknown')})")
                 
             print(f"\n   Sample Edges:")
-            for i, edge in enumerate(hg_analysis['edges'][:3], 1):
+            for i, edge in enumerate(islice(hg_analysis['edges'], 3), 1):
                 print(f"     {i}. {edge.get('source', '?')} → {edge.get('target', '?')} ({edge.get('type', 'unknown')})")
         else:
             print(f"   {hg_analysis}")
@@ -7,9 +7,27 @@ import boto3
 import json
 import time
 import sys
+import threading
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import uuid
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# Test cases run concurrently, so throttling is left to the SDK's adaptive
+# retry backoff rather than fixed sleeps between cases
+CLIENT_CONFIG = Config(retries={'mode': 'adaptive', 'max_attempts': 10})
+
+@lru_cache(maxsize=None)
+def _get_session(profile: str, region: str) -> boto3.Session:
+    """Create one boto3 session per profile/region"""
+    return boto3.Session(profile_name=profile, region_name=region)
+
+@lru_cache(maxsize=None)
+def _get_client(profile: str, region: str, service: str):
+    """Create one client per profile/region/service, shared by all testers"""
+    return _get_session(profile, region).client(service, config=CLIENT_CONFIG)
 
 class AdditionalFilesTester:
     def __init__(self, profile: str = 'development', region: str = 'us-west-1', environment: str = 'dev'):
@@ -18,33 +36,43 @@ class AdditionalFilesTester:
         self.environment = environment
         
         # Initialize AWS clients
-        self.session = boto3.Session(profile_name=profile, region_name=region)
-        self.stepfunctions = self.session.client('stepfunctions')
-        self.dynamodb = self.session.resource('dynamodb')
-        self.s3 = self.session.client('s3')
+        self.session = _get_session(profile, region)
+        self.stepfunctions = _get_client(profile, region, 'stepfunctions')
+        self.s3 = _get_client(profile, region, 's3')
         
         # Configuration
-        self.account_id = self.session.client('sts').get_caller_identity()['Account']
+        self.account_id = _get_client(profile, region, 'sts').get_caller_identity()['Account']
         self.bucket_name = f"agentic-framework-input-files-{environment}-{self.account_id}"
         self.state_machine_name = f"agentic-framework-processing-workflow-{environment}"
+        self._state_machine_arn: Optional[str] = None
         
         # Test results
         self.test_results = []
+        
+        # Name of the test case running on the current thread, used to tell
+        # the interleaved output of concurrent test cases apart
+        self._current_test = threading.local()
 
     def print_status(self, message: str, status: str = 'INFO'):
         """Print formatted status message"""
         icons = {'SUCCESS': '✅', 'ERROR': '❌', 'WARNING': '⚠️', 'INFO': 'ℹ️', 'RUNNING': '🔄'}
         icon = icons.get(status, 'ℹ️')
         timestamp = datetime.now().strftime('%H:%M:%S')
-        print(f"[{timestamp}] {icon} {message}")
+        test_name = getattr(self._current_test, 'name', None)
+        prefix = f"[{test_name}] " if test_name else ''
+        print(f"[{timestamp}] {icon} {prefix}{message}")
 
     def get_state_machine_arn(self) -> str:
-        """Get the Step Functions state machine ARN"""
+        """Get the Step Functions state machine ARN (looked up once, then cached)"""
+        if self._state_machine_arn:
+            return self._state_machine_arn
         try:
-            response = self.stepfunctions.list_state_machines()
-            for sm in response['stateMachines']:
-                if sm['name'] == self.state_machine_name:
-                    return sm['stateMachineArn']
+            paginator = self.stepfunctions.get_paginator('list_state_machines')
+            for page in paginator.paginate():
+                for sm in page['stateMachines']:
+                    if sm['name'] == self.state_machine_name:
+                        self._state_machine_arn = sm['stateMachineArn']
+                        return self._state_machine_arn
             raise Exception(f"State machine not found: {self.state_machine_name}")
         except Exception as e:
             raise Exception(f"Failed to get state machine ARN: {str(e)}")
@@ -99,6 +127,7 @@ class AdditionalFilesTester:
     def monitor_execution(self, execution_arn: str, timeout: int = 300) -> Dict[str, Any]:
         """Monitor Step Functions execution until completion"""
         start_time = time.time()
+        delay = 1.0
         
         while time.time() - start_time < timeout:
             try:
@@ -133,7 +162,8 @@ class AdditionalFilesTester:
                 # Still running
                 elapsed = time.time() - start_time
                 self.print_status(f"Execution running... ({elapsed:.1f}s)", 'RUNNING')
-                time.sleep(10)  # Check every 10 seconds
+                time.sleep(min(delay, max(timeout - elapsed, 0)))
+                delay = min(delay * 2, 15)  # Back off: 1s, 2s, 4s, 8s, then every 15s
                 
             except Exception as e:
                 return {
@@ -152,11 +182,14 @@ class AdditionalFilesTester:
     def extract_hypergraph_from_execution(self, execution_arn: str):
         """Extract hypergraph data from Step Functions execution history"""
         try:
-            response = self.stepfunctions.get_execution_history(executionArn=execution_arn)
-            events = response['events']
+            # The hypergraph builder runs near the end of the workflow, so read
+            # the history from the tail and stop at the first match
+            paginator = self.stepfunctions.get_paginator('get_execution_history')
+            pages = paginator.paginate(executionArn=execution_arn, reverseOrder=True,
+                                       PaginationConfig={'PageSize': 100})
             
             # Look for the hypergraph builder task completion
-            for event in events:
+            for event in (event for page in pages for event in page['events']):
                 if event['type'] == 'TaskSucceeded':
                     details = event.get('taskSucceededEventDetails', {})
                     output = details.get('output', '{}')
@@ -190,7 +223,7 @@ class AdditionalFilesTester:
             return None
             
         except Exception as e:
-            print(f"Error extracting hypergraph: {str(e)}")
+            self.print_status(f"Error extracting hypergraph: {str(e)}", 'ERROR')
             return None
 
     def run_single_test(self, file_path: str, customer_folder: str, customer_name: str, content_description: str) -> Dict[str, Any]:
@@ -269,6 +302,14 @@ class AdditionalFilesTester:
             self.print_status(f"Test failed with error: {str(e)}", 'ERROR')
             return test_result
 
+    def _run_test_case(self, test_case: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one test case with its progress lines prefixed by the customer name"""
+        self._current_test.name = test_case['customer_name']
+        try:
+            return self.run_single_test(**test_case)
+        finally:
+            self._current_test.name = None
+
     def run_additional_files_test(self) -> Dict[str, Any]:
         """Run tests with different files from existing customers"""
         self.print_status("🚀 Starting Additional Files Test", 'INFO')
@@ -290,19 +331,18 @@ class AdditionalFilesTester:
             }
         ]
         
-        # Run tests
         for i, test_case in enumerate(test_cases, 1):
             self.print_status(f"\n📋 Test {i}/{len(test_cases)}: {test_case['customer_name']}", 'INFO')
             self.print_status(f"Content: {test_case['content_description']}", 'INFO')
-            self.print_status("-" * 40, 'INFO')
-            
-            result = self.run_single_test(**test_case)
-            self.test_results.append(result)
-            
-            # Add delay between tests to avoid throttling
-            if i < len(test_cases):
-                self.print_status("Waiting 30 seconds before next test...", 'INFO')
-                time.sleep(30)
+        self.print_status("-" * 40, 'INFO')
+        
+        # Run tests concurrently - each one mostly waits on Step Functions.
+        # Results are collected in test case order. One thread per case is
+        # cheap at this scale, and an aioboto3 port would add a dependency
+        # and async copies of every method without shortening the run
+        with ThreadPoolExecutor(max_workers=len(test_cases)) as executor:
+            futures = [executor.submit(self._run_test_case, test_case) for test_case in test_cases]
+            self.test_results.extend(future.result() for future in futures)
         
         return self.test_results
 